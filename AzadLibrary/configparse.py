@@ -90,6 +90,9 @@ class TaskConfiguration:
 
         # Floating point precision
         self.floatPrecision = float(precision)
+        if self.floatPrecision <= 0:
+            raise ValueError("Non-positive precision %g" %
+                             (self.floatPrecision,))
 
         # Parameters: [(name, iovt, dimension), ..]
         logger.debug("Validating parameters..")
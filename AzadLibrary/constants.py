@@ -7,6 +7,7 @@ This module should not import any other part of Azad library.
 from enum import Enum
 from decimal import Decimal
 from fractions import Fraction
+from math import isclose as _isclose
 import os
 from sys import float_info
 import typing
@@ -34,6 +35,13 @@ MaxParameterDimensionAllowed = 2
 DefaultGeneratorTL = 10.0
 DefaultValidatorTL = 10.0
 
+# Compiled executables are cached across runs in per-user cache directory,
+# `$XDG_CACHE_HOME/azadlib/compilation` or `~/.cache/azadlib/compilation`.
+# Set environment variable below to non-empty value to disable caching.
+CompilationCacheSubpath = Path("azadlib") / "compilation"
+CompilationCacheDisableEnv = "AZADLIB_NO_COMPILATION_CACHE"
+CompilationCacheMaxAge = 14 * 24 * 60 * 60  # seconds since last use
+
 # Log related
 DefaultLoggingFileName = "azadlib.log"
 DefaultLogFileMaxSize = 10 * (2 ** 20)  # 10MB
@@ -60,9 +68,10 @@ def __IODataTypesInfo_StringConstraints(x: str):
 def __IODataTypesInfo_FloatStrize(x: typing.Union[float, Decimal, Fraction]):
     """
     Strize function for floating point numbers.
+    Plain floats use `repr`, which is the shortest round-trip string.
     """
-    result = str(Decimal(x))
-    if "." not in result:
+    result = repr(x) if type(x) is float else str(Decimal(x))
+    if "." not in result and "e" not in result and "E" not in result:
         result += ".0"
     return result
 
@@ -71,13 +80,10 @@ def checkPrecision(a: float, b: float,
                    precision: float = DefaultFloatPrecision) -> bool:
     """
     Check similarity between two float numbers with given precision.
+    Precision is used as both absolute and relative tolerance.
+    Positiveness of precision should be validated by caller.
     """
-    if precision <= 0:
-        raise ValueError("Non-positive precision %f given" % (precision,))
-    elif abs(a) <= precision ** 2:
-        return abs(a - b) <= precision
-    else:
-        return abs(a - b) <= precision or abs((a - b) / a) <= precision
+    return _isclose(a, b, rel_tol=precision, abs_tol=precision)
 
 
 class IOVariableTypes(Enum):
@@ -101,32 +107,54 @@ IODataTypesIndirect = {
     IOVariableTypes.STRING: {"string", "char*"},
     IOVariableTypes.BOOL: {"boolean"}
 }
-for _iovt in IOVariableTypes:
-    assert _iovt in IODataTypesIndirect
+if __debug__:  # Stripped by `python3 -O`
+    assert set(IODataTypesIndirect.keys()) == set(IOVariableTypes)
+
+# All direct and indirect names of IOVariableTypes.
+IODataTypesByName = {
+    name: iovt for iovt in IOVariableTypes
+    for name in (iovt.value, *IODataTypesIndirect[iovt])
+}
 
 
 def getIOVariableType(s: str) -> IOVariableTypes:
     """
     Get IOVariableType of given string.
     """
-    for iovt in IOVariableTypes:
-        if s == iovt.value or s in IODataTypesIndirect[iovt]:
-            return iovt
-    raise ValueError("There is no such IODataType '%s'" % (s,))
+    try:
+        return IODataTypesByName[s]
+    except KeyError:
+        raise ValueError("There is no such IODataType '%s'" % (s,))
+
+
+# Inclusive value ranges of integer I/O data types.
+# These are also used to check constraints of whole arrays at once.
+IODataTypesIntegerRange = {
+    IOVariableTypes.INT: (-(2**31), 2**31 - 1),
+    IOVariableTypes.LONG: (-(2**63), 2**63 - 1),
+}
+
+
+def __IODataTypesInfo_IntegerConstraint(iovt: IOVariableTypes):
+    """
+    Return constraint function of given integer type.
+    """
+    lower, upper = IODataTypesIntegerRange[iovt]
+    return (lambda x: lower <= x <= upper)
 
 
 # Information of I/O data types.
 IODataTypesInfo = {
     IOVariableTypes.INT: {
         "pytypes": (int,),
-        "constraint": (lambda x: -(2**31) <= x <= 2**31 - 1),
-        "strize": (lambda x: "%d" % (x,)),
+        "constraint": __IODataTypesInfo_IntegerConstraint(IOVariableTypes.INT),
+        "strize": str,
         "equal": (lambda x, y: x == y),
     },
     IOVariableTypes.LONG: {
         "pytypes": (int,),
-        "constraint": (lambda x: -(2**63) <= x <= 2**63 - 1),
-        "strize": (lambda x: "%d" % (x,)),
+        "constraint": __IODataTypesInfo_IntegerConstraint(IOVariableTypes.LONG),
+        "strize": str,
         "equal": (lambda x, y: x == y),
     },
     IOVariableTypes.FLOAT: {
@@ -150,19 +178,19 @@ IODataTypesInfo = {
     IOVariableTypes.BOOL: {
         "pytypes": (bool, int),
         "constraint": (lambda x: isinstance(x, bool) or (x in (0, 1))),
-        "strize": (lambda x: "true" if x else "false"),
+        "strize": ("false", "true").__getitem__,
         "equal": (lambda x, y: x == y),
     }
 }
-for _iovt in IODataTypesInfo:
-    _dtinfo = IODataTypesInfo[_iovt]
-    assert isinstance(_dtinfo, dict)
-    assert set(_dtinfo.keys()) == {"pytypes", "constraint", "strize", "equal"}
-    assert isinstance(_dtinfo["pytypes"], (list, tuple))
-    for _t in _dtinfo["pytypes"]:
-        assert isinstance(_t, type)
-    assert callable(_dtinfo["constraint"])
-    assert callable(_dtinfo["strize"])
+
+if __debug__:  # Stripped by `python3 -O`
+    for _iovt, _dtinfo in IODataTypesInfo.items():
+        assert isinstance(_dtinfo, dict) and \
+            set(_dtinfo.keys()) == {"pytypes", "constraint", "strize", "equal"} and \
+            isinstance(_dtinfo["pytypes"], (list, tuple)) and \
+            all(isinstance(_t, type) for _t in _dtinfo["pytypes"]) and \
+            callable(_dtinfo["constraint"]) and callable(_dtinfo["strize"]), \
+            "Invalid IODataTypesInfo entry for %s" % (_iovt,)
 
 
 class Verdict(Enum):
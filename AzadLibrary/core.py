@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 import typing
 import atexit
+import functools
 import gc
 import logging
 import warnings
@@ -59,9 +60,8 @@ class AzadCore:
                     self.concurrencyCount)
 
         # Replace precision equality function
-        _iovt_precision_eq = (
-            lambda x, y: Const.checkPrecision(
-                x, y, precision=self.config.floatPrecision))
+        _iovt_precision_eq = functools.partial(
+            Const.checkPrecision, precision=self.config.floatPrecision)
         Const.IODataTypesInfo[Const.IOVariableTypes.FLOAT]["equal"] = \
             _iovt_precision_eq
         Const.IODataTypesInfo[Const.IOVariableTypes.DOUBLE]["equal"] = \
@@ -150,8 +150,6 @@ class AzadCore:
                 Const.SourceFileType.Generator,
                 "Generator %s" % (generatorName,),
                 namePrefix="origin_generator")
-            self.generatorModules[generatorName].preparePipeline()
-            logger.debug("Prepared generator \"%s\".", generatorName)
 
         # Validator module
         if self.config.validator:
@@ -159,8 +157,6 @@ class AzadCore:
                 self.config.validator,
                 Const.SourceFileType.Validator, "Validator",
                 namePrefix="origin_validator")
-            self.validatorModule.preparePipeline()
-            logger.debug("Prepared validator.")
 
         # Solution modules
         for categories in self.config.solutions:
@@ -170,9 +166,40 @@ class AzadCore:
                     path, Const.SourceFileType.Solution,
                     "Solution '%s'" % (formatPathForLog(path),),
                     namePrefix="origin_solution"))
-                self.solutionModules[categories][-1].preparePipeline()
-                logger.debug("Prepared solution \"%s\".",
-                             formatPathForLog(path))
+
+        # Prepare all modules; Compilations are independent each other
+        modules: typing.List[ExternalModule.AbstractExternalModule] = \
+            list(self.generatorModules.values())
+        if self.validatorModule is not None:
+            modules.append(self.validatorModule)
+        for categories in self.solutionModules:
+            modules.extend(self.solutionModules[categories])
+        errors: typing.List[typing.Union[BaseException, None]] = \
+            [None for _ in modules]
+
+        def run(index: int):
+            """
+            Helper function to prepare independent module.
+            Use this under `misc.runThreads`.
+            """
+            try:
+                modules[index].preparePipeline()
+            except BaseException as err:
+                errors[index] = err
+            else:
+                logger.debug("Prepared %s.", modules[index].name)
+
+        # Do multithreading
+        timeDiff, _ = runThreads(
+            run, self.concurrencyCount,
+            *[((i,), {}) for i in range(len(modules))],
+            funcName="Preparation")
+        logger.info("Finished all preparation in %g seconds.", timeDiff)
+
+        # Raise first error if there is any failure
+        for err in errors:
+            if err is not None:
+                raise err
 
     def generateInput(self) -> typing.List[Path]:
         """
@@ -18,6 +18,21 @@ from ..filesystem import TempFileSystem
 from ..misc import isExistingFile, limitSubprocessResource
 from ..errors import AzadError
 
+# Template files loaded so far; Templates don't change at runtime.
+_templateCache: typing.Dict[Path, StringTemplate] = {}
+
+
+def loadTemplate(templatePath: Path) -> StringTemplate:
+    """
+    Load given template file. Each file is read from disk only once.
+    """
+    template = _templateCache.get(templatePath, None)
+    if template is None:
+        with open(templatePath, "r") as templateFile:
+            template = StringTemplate(templateFile.read())
+        _templateCache[templatePath] = template
+    return template
+
 
 class AbstractProgrammingLanguage:
     """
@@ -146,10 +161,9 @@ class AbstractExternalModule:
     def replaceSymbols(sourceCodePath: Path, mapping: dict) -> str:
         """
         Read sourcecode and replace symbols by mapping.
+        All symbols are replaced in a single regex scan by `substitute`.
         """
-        with open(sourceCodePath, "r") as sourceCodeFile:
-            template = StringTemplate(sourceCodeFile.read())
-        return template.substitute(mapping)
+        return loadTemplate(sourceCodePath).substitute(mapping)
 
     # Global semaphore for invocation
     globalInvokeSemaphore = threading.BoundedSemaphore()
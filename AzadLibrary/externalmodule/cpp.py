@@ -5,13 +5,21 @@ This module provides implementation of C++ external module.
 # Standard libraries
 import typing
 from pathlib import Path
+import functools
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Azad libraries
 from .. import constants as Const
-from ..misc import isExistingFile, removeExtension, formatPathForLog
+from ..misc import (
+    isExistingFile, removeExtension, formatPathForLog, randomName)
 from ..errors import AzadError
 from .abstract import (
     AbstractProgrammingLanguage, AbstractExternalGenerator,
@@ -37,6 +45,76 @@ def reportCompilationFailure(
             (moduleType.name, formatPathForLog(modulePath), newArgs))
 
 
+@functools.lru_cache(maxsize=None)
+def getCompilationCachePath() -> Const.OptionalPath:
+    """
+    Return per-user compilation cache directory.
+    Return None if caching is disabled, or the directory is
+    not a private directory of current user. Resolved once per process.
+    """
+    if os.environ.get(Const.CompilationCacheDisableEnv, ""):
+        logger.info("Compilation cache is disabled by $%s.",
+                    Const.CompilationCacheDisableEnv)
+        return None
+    try:
+        base = os.environ.get("XDG_CACHE_HOME", "")
+        base = Path(base) if os.path.isabs(base) else Path.home() / ".cache"
+        path = base / Const.CompilationCacheSubpath
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        pathStat = path.lstat()
+    except (OSError, RuntimeError) as err:
+        logger.warning("Compilation cache is not available (%s); "
+                       "Compiling without cache.", err)
+        return None
+    if not stat.S_ISDIR(pathStat.st_mode) or \
+            pathStat.st_uid != os.getuid() or pathStat.st_mode & 0o077:
+        logger.warning("Compilation cache \"%s\" is not a private directory "
+                       "of current user; Compiling without cache.", path)
+        return None
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def getCompilerVersion(compiler: str) -> str:
+    """
+    Return output of `compiler --version`, or empty string
+    if it's not available. Resolved once per process.
+    """
+    try:
+        return subprocess.run(
+            [compiler, "--version"], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, timeout=30,
+            encoding="utf-8", errors="replace").stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def isTrustedCacheEntry(path: Path) -> bool:
+    """
+    Check if given path is regular file owned and
+    writable only by current user.
+    """
+    try:
+        pathStat = path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISREG(pathStat.st_mode) and \
+        pathStat.st_uid == os.getuid() and not pathStat.st_mode & 0o022
+
+
+def cleanCompilationCache(cachePath: Path):
+    """
+    Remove cache entries which are not used for a long time.
+    """
+    deadline = time.time() - Const.CompilationCacheMaxAge
+    for entry in cachePath.iterdir():
+        try:
+            if entry.lstat().st_mtime < deadline:
+                entry.unlink()
+        except OSError:
+            pass
+
+
 class AbstractCpp(AbstractProgrammingLanguage):
     """
     C++ specification of abstract programming language.
@@ -52,6 +130,7 @@ class AbstractCpp(AbstractProgrammingLanguage):
     }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def typeStr(cls, iovt: Const.IOVariableTypes, dimension: int):
         return cls.baseTypeStrTable[iovt] if dimension == 0 else \
             "std::vector<%s>" % cls.typeStr(iovt, dimension - 1)
@@ -65,6 +144,9 @@ class AbstractCpp(AbstractProgrammingLanguage):
         "templates/validator_cpp.template"
     helperHeadersPath = Const.ResourcesPath / "helpers"
 
+    # Compiler invocations are launched by ccache if available
+    ccachePath = shutil.which("ccache")
+
     # Indent level
     indentLevelParameterInit = 1
     indentLevelParameterGet = 2
@@ -73,6 +155,126 @@ class AbstractCpp(AbstractProgrammingLanguage):
     # Converted variable name on C++ code
     vnameByPname = (lambda name: "_param_%s" % (name,))
 
+    @classmethod
+    def compilerCommand(cls, compiler: str) -> Const.ArgType:
+        """
+        Return `[(ccache), compiler, -pipe]` to start compilation args.
+        """
+        return ([cls.ccachePath] if cls.ccachePath else []) + \
+            [compiler, "-pipe"]
+
+    @classmethod
+    def cppCompilationArgs(
+            cls, mainModulePath: Path, executable: Path,
+            originalModulePath: Path) -> Const.ArgType:
+        """
+        Generate arguments to compile C++ main module and
+        original module together into given executable.
+        """
+        return cls.compilerCommand("g++") + [
+            "-Wall", "-std=c++17", "-O2",
+            "-I", cls.helperHeadersPath,
+            mainModulePath, originalModulePath,
+            "-o", executable
+        ]
+
+    @classmethod
+    def compilationSignature(cls) -> Const.ArgType:
+        """
+        Return compilation args with placeholder paths
+        instead of temporary source and executable paths.
+        """
+        return cls.generateCompilationArgs(
+            Path("main.cpp"), Path("main.exe"), Path("original.cpp"))
+
+    @classmethod
+    def cachedExecutableName(
+            cls, namePrefix: str,
+            *sources: typing.Union[str, Path]) -> str:
+        """
+        Return cached executable name for given sources.
+        `Path` sources are read as file; Library version, compilation
+        args, compiler versions and helper headers are also included
+        in the digest.
+        """
+        signature = [str(arg) for arg in cls.compilationSignature()]
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (cls.__name__, Const.AzadLibraryVersion,
+                     "\0".join(signature)):
+            digest.update(part.encode() + b"\0")
+        for compiler in sorted({"gcc", "g++"}.intersection(signature)):
+            digest.update(getCompilerVersion(compiler).encode() + b"\0")
+        for headerPath in sorted(cls.helperHeadersPath.glob("*.hpp")):
+            digest.update(headerPath.read_bytes() + b"\0")
+        for source in sources:
+            digest.update((source.read_bytes() if isinstance(source, Path)
+                           else source.encode()) + b"\0")
+        return "%s_%s.exe" % (namePrefix, digest.hexdigest())
+
+    def compileExecutable(
+            self, executable: Path, sourceType: Const.SourceFileType):
+        """
+        Compile `self.modulePath` and `self.originalModulePath`
+        into given executable path.
+        """
+        compilationArgs = self.generateCompilationArgs(
+            self.modulePath, executable, self.originalModulePath)
+        compilationErrorLog = self.fs.newTempFile(
+            extension="log", namePrefix="err")
+        compilationExitCode = self.invoke(
+            compilationArgs, stderr=compilationErrorLog,
+            cwd=self.fs.basePath)
+        if compilationExitCode is not Const.ExitCode.Success:
+            reportCompilationFailure(
+                compilationErrorLog, self.originalModulePath,
+                compilationArgs, sourceType)
+
+    def prepareExecutable(
+            self, code: str, sourceType: Const.SourceFileType) -> Path:
+        """
+        Return executable built from given generated code and
+        original module. If compilation cache has an executable built
+        from same inputs, use it. Otherwise compile into `self.fs` and
+        store a copy into cache. Problems of the cache itself are
+        only logged, never reported as compilation failure.
+        """
+        cachePath = getCompilationCachePath()
+        cachedExecutable: Const.OptionalPath = None
+        if cachePath is not None:
+            cachedExecutable = cachePath / self.cachedExecutableName(
+                sourceType.value, code, self.originalModulePath)
+            if isTrustedCacheEntry(cachedExecutable):
+                try:  # Mark as recently used
+                    os.utime(cachedExecutable)
+                except OSError:
+                    pass
+                logger.debug("Using cached executable \"%s\" for %s.",
+                             formatPathForLog(cachedExecutable), self.name)
+                return cachedExecutable
+
+        # Compile in temp file system as usual
+        executable = self.fs.newTempFile(
+            extension="exe", namePrefix=sourceType.value)
+        self.compileExecutable(executable, sourceType)
+
+        # Store into cache; Atomically move a copy into place
+        if cachedExecutable is not None:
+            tempExecutable = cachedExecutable.with_name(
+                "%s.%s.temp" % (cachedExecutable.name, randomName(10)))
+            try:
+                shutil.copy2(executable, tempExecutable)
+                os.chmod(tempExecutable, stat.S_IRWXU)  # Ignore umask
+                os.replace(tempExecutable, cachedExecutable)
+            except OSError as err:
+                logger.warning("Failed to store executable of %s "
+                               "into compilation cache (%s).", self.name, err)
+                try:
+                    tempExecutable.unlink()
+                except OSError:
+                    pass
+            cleanCompilationCache(cachePath)
+        return executable
+
     @classmethod
     def templateDict(
             cls, *args, parameterInfo: typing.List[typing.Tuple[
@@ -158,12 +360,8 @@ class CppGenerator(AbstractExternalGenerator, AbstractCpp):
     def generateCompilationArgs(
             cls, mainModulePath: Path, executable: Path,
             originalModulePath: Path, *args, **kwargs) -> Const.ArgType:
-        return [
-            "g++", "-Wall", "-std=c++17", "-O2",
-            "-I", cls.helperHeadersPath,
-            mainModulePath, originalModulePath,
-            "-o", executable
-        ]
+        return cls.cppCompilationArgs(
+            mainModulePath, executable, originalModulePath)
 
     @classmethod
     def generateCode(
@@ -185,19 +383,8 @@ class CppGenerator(AbstractExternalGenerator, AbstractCpp):
             content=code, extension="cpp", namePrefix="generator")
 
         # Compile
-        self.executable = self.fs.newTempFile(
-            extension="exe", namePrefix="generator")
-        compilationArgs = self.generateCompilationArgs(
-            self.modulePath, self.executable, self.originalModulePath)
-        compilationErrorLog = self.fs.newTempFile(
-            extension="log", namePrefix="err")
-        compilationExitCode = self.invoke(
-            compilationArgs, stderr=compilationErrorLog,
-            cwd=self.fs.basePath)
-        if compilationExitCode is not Const.ExitCode.Success:
-            reportCompilationFailure(
-                compilationErrorLog, self.originalModulePath,
-                compilationArgs, Const.SourceFileType.Generator)
+        self.executable = self.prepareExecutable(
+            code, Const.SourceFileType.Generator)
 
         self.prepared = True
 
@@ -215,12 +402,8 @@ class CppValidator(AbstractExternalValidator, AbstractCpp):
     def generateCompilationArgs(
             cls, mainModulePath: Path, executable: Path,
             originalModulePath: Path, *args, **kwargs) -> Const.ArgType:
-        return [
-            "g++", "-Wall", "-std=c++17", "-O2",
-            "-I", cls.helperHeadersPath,
-            mainModulePath, originalModulePath,
-            "-o", executable
-        ]
+        return cls.cppCompilationArgs(
+            mainModulePath, executable, originalModulePath)
 
     @classmethod
     def generateCode(
@@ -245,19 +428,8 @@ class CppValidator(AbstractExternalValidator, AbstractCpp):
             content=code, extension="cpp", namePrefix="validator")
 
         # Compile
-        self.executable = self.fs.newTempFile(
-            extension="exe", namePrefix="validator")
-        compilationArgs = self.generateCompilationArgs(
-            self.modulePath, self.executable, self.originalModulePath)
-        compilationErrorLog = self.fs.newTempFile(
-            extension="log", namePrefix="err")
-        compilationExitCode = self.invoke(
-            compilationArgs, stderr=compilationErrorLog,
-            cwd=self.fs.basePath)
-        if compilationExitCode is not Const.ExitCode.Success:
-            reportCompilationFailure(
-                compilationErrorLog, self.originalModulePath,
-                compilationArgs, Const.SourceFileType.Validator)
+        self.executable = self.prepareExecutable(
+            code, Const.SourceFileType.Validator)
 
         self.prepared = True
 
@@ -275,12 +447,8 @@ class CppSolution(AbstractExternalSolution, AbstractCpp):
     def generateCompilationArgs(
             cls, mainModulePath: Path, executable: Path,
             originalModulePath: Path, *args, **kwargs) -> Const.ArgType:
-        return [
-            "g++", "-Wall", "-std=c++17", "-O2",
-            "-I", cls.helperHeadersPath,
-            mainModulePath, originalModulePath,
-            "-o", executable
-        ]
+        return cls.cppCompilationArgs(
+            mainModulePath, executable, originalModulePath)
 
     @classmethod
     def generateCode(
@@ -305,20 +473,8 @@ class CppSolution(AbstractExternalSolution, AbstractCpp):
             content=code, extension="cpp", namePrefix="solution")
 
         # Compile
-        self.executable = self.fs.newTempFile(
-            extension="exe", namePrefix="solution")
-        compilationArgs = self.generateCompilationArgs(
-            self.modulePath, self.executable,
-            self.originalModulePath)
-        compilationErrorLog = self.fs.newTempFile(
-            extension="log", namePrefix="err")
-        compilationExitCode = self.invoke(
-            compilationArgs, stderr=compilationErrorLog,
-            cwd=self.fs.basePath)
-        if compilationExitCode is not Const.ExitCode.Success:
-            reportCompilationFailure(
-                compilationErrorLog, self.originalModulePath,
-                compilationArgs, Const.SourceFileType.Solution)
+        self.executable = self.prepareExecutable(
+            code, Const.SourceFileType.Solution)
 
         self.prepared = True
 
@@ -484,6 +640,55 @@ class CSolution(AbstractExternalSolution, AbstractC):
                 returnInfo=returnInfo)
         )
 
+    @classmethod
+    def generateCompilationArgsC(
+            cls, originalModulePath: Path,
+            objectPath: Path) -> Const.ArgType:
+        """
+        Generate arguments to compile original C module into object.
+        """
+        return cls.compilerCommand("gcc") + [
+            "-c", originalModulePath,
+            "-std=c11", "-O2", "-Wall",
+            "-I", cls.helperHeadersPath,
+            "-o", objectPath
+        ]
+
+    @classmethod
+    def generateCompilationArgsCpp(
+            cls, mainModulePath: Path,
+            objectPath: Path) -> Const.ArgType:
+        """
+        Generate arguments to compile C++ main module into object.
+        """
+        return cls.compilerCommand("g++") + [
+            "-c", mainModulePath,
+            "-std=c++17", "-O2", "-Wall",
+            "-I", cls.helperHeadersPath,
+            "-o", objectPath
+        ]
+
+    @classmethod
+    def generateLinkArgs(
+            cls, objectPathC: Path, objectPathCpp: Path,
+            executable: Path) -> Const.ArgType:
+        """
+        Generate arguments to link C and C++ objects into executable.
+        """
+        return cls.compilerCommand("g++") + [
+            objectPathC, objectPathCpp,
+            "-o", executable
+        ]
+
+    @classmethod
+    def compilationSignature(cls) -> Const.ArgType:
+        return cls.generateCompilationArgsC(
+            Path("original.c"), Path("original.o")) + \
+            cls.generateCompilationArgsCpp(
+                Path("main.cpp"), Path("main.o")) + \
+            cls.generateLinkArgs(
+                Path("original.o"), Path("main.o"), Path("main.exe"))
+
     def preparePipeline(self):
 
         # Prepare original stuffs
@@ -491,14 +696,19 @@ class CSolution(AbstractExternalSolution, AbstractC):
         self.modulePath = self.fs.newTempFile(
             content=code, extension="cpp", namePrefix="solution")
 
+        # Compile
+        self.executable = self.prepareExecutable(
+            code, Const.SourceFileType.Solution)
+        self.prepared = True
+
+    def compileExecutable(
+            self, executable: Path, sourceType: Const.SourceFileType):
+
         # Compile: C
         executableTempC = self.fs.newTempFile(
             extension="exe", namePrefix="solution")
-        compilationArgs1 = [
-            "gcc", "-c", self.originalModulePath,
-            "-std=c11", "-O2", "-Wall",
-            "-I", self.helperHeadersPath,
-            "-o", executableTempC]
+        compilationArgs1 = self.generateCompilationArgsC(
+            self.originalModulePath, executableTempC)
         compilationErrorLog1 = self.fs.newTempFile(
             extension="log", namePrefix="err")
         compilationExitCode1 = self.invoke(
@@ -509,17 +719,13 @@ class CSolution(AbstractExternalSolution, AbstractC):
         if compilationExitCode1 is not Const.ExitCode.Success:
             reportCompilationFailure(
                 compilationErrorLog1, self.originalModulePath,
-                compilationArgs1, Const.SourceFileType.Solution)
+                compilationArgs1, sourceType)
 
         # Compile: C++
         executableTempCpp = self.fs.newTempFile(
             extension="exe", namePrefix="solution")
-        compilationArgs2 = [
-            "g++", "-c", self.modulePath,
-            "-std=c++17", "-O2", "-Wall",
-            "-I", self.helperHeadersPath,
-            "-o", executableTempCpp
-        ]
+        compilationArgs2 = self.generateCompilationArgsCpp(
+            self.modulePath, executableTempCpp)
         compilationErrorLog2 = self.fs.newTempFile(
             extension="log", namePrefix="err")
         compilationExitCode2 = self.invoke(
@@ -530,15 +736,11 @@ class CSolution(AbstractExternalSolution, AbstractC):
         if compilationExitCode2 is not Const.ExitCode.Success:
             reportCompilationFailure(
                 compilationErrorLog2, self.modulePath,
-                compilationArgs2, Const.SourceFileType.Solution)
+                compilationArgs2, sourceType)
 
         # Compile: Together
-        self.executable = self.fs.newTempFile(
-            extension="exe", namePrefix="solution")
-        compilationArgs3 = [
-            "g++", executableTempC, executableTempCpp,
-            "-o", self.executable
-        ]
+        compilationArgs3 = self.generateLinkArgs(
+            executableTempC, executableTempCpp, executable)
         compilationErrorLog3 = self.fs.newTempFile(
             extension="log", namePrefix="err")
         compilationExitCode3 = self.invoke(
@@ -549,9 +751,8 @@ class CSolution(AbstractExternalSolution, AbstractC):
         if compilationExitCode3 is not Const.ExitCode.Success:
             reportCompilationFailure(
                 compilationErrorLog3, executableTempCpp,
-                compilationArgs3, Const.SourceFileType.Solution)
+                compilationArgs3, sourceType)
 
         # Clean useless binary files
         self.fs.pop(executableTempC, b=True)
         self.fs.pop(executableTempCpp, b=True)
-        self.prepared = True
@@ -4,7 +4,8 @@ This module is used to define and support I/O data (for problems) related stuffs
 
 # Standard libraries
 import typing
-import os
+import io
+from itertools import islice
 from pathlib import Path
 
 # Azad libraries
@@ -18,11 +19,10 @@ def cleanIOFilePath(path: typing.Union[str, Path],
     """
     if isinstance(path, str):
         path = Path(path)
+    suffixes = {"." + extension.lstrip(".") for extension in targetExtensions}
     for filename in path.iterdir():
-        for extension in targetExtensions:
-            if filename.name.endswith(extension):
-                os.remove(filename)
-                break
+        if filename.suffix in suffixes and filename.is_file():
+            filename.unlink()
 
 
 def yieldLines(path: typing.Union[str, Path]) -> typing.Iterator[str]:
@@ -38,10 +38,47 @@ def PGizeData(data, iovt: Const.IOVariableTypes) -> str:
     """
     Transfer data into Programmers-compatible string.
     """
-    if isinstance(data, (list, tuple)):
-        return "[%s]" % (",".join(PGizeData(d, iovt) for d in data),)
-    else:
-        return Const.IODataTypesInfo[iovt]["strize"](data)
+    strize = Const.IODataTypesInfo[iovt]["strize"]
+    buffer = io.StringIO()
+    write = buffer.write
+
+    def recursion(d):
+        if type(d) not in (list, tuple):
+            write(strize(d))
+        elif d and type(d[0]) not in (list, tuple):  # Innermost row
+            write("[")
+            write(",".join(map(strize, d)))
+            write("]")
+        else:
+            write("[")
+            for i in range(len(d)):
+                if i > 0:
+                    write(",")
+                recursion(d[i])
+            write("]")
+
+    recursion(data)
+    return buffer.getvalue()
+
+
+def parseBool(line: str) -> bool:
+    """
+    Parse the given line as boolean.
+    """
+    if line not in ("true", "false"):
+        raise ValueError
+    return line == "true"
+
+
+# Single line parser for each I/O variable type.
+singleParsers: typing.Mapping[
+    Const.IOVariableTypes, typing.Callable[[str], typing.Any]] = {
+    Const.IOVariableTypes.INT: int,
+    Const.IOVariableTypes.LONG: int,
+    Const.IOVariableTypes.FLOAT: float,
+    Const.IOVariableTypes.DOUBLE: float,
+    Const.IOVariableTypes.BOOL: parseBool,
+}
 
 
 def parseSingle(line: str, targetType: Const.IOVariableTypes) \
@@ -49,16 +86,10 @@ def parseSingle(line: str, targetType: Const.IOVariableTypes) \
     """
     Parse the given line with given target type.
     """
-    if targetType in (Const.IOVariableTypes.INT, Const.IOVariableTypes.LONG):
-        return int(line)
-    elif targetType in (Const.IOVariableTypes.FLOAT, Const.IOVariableTypes.DOUBLE):
-        return float(line)
-    elif targetType is Const.IOVariableTypes.BOOL:
-        if line not in ("true", "false"):
-            raise ValueError
-        return line == "true"
-    else:
+    parser = singleParsers.get(targetType, None)
+    if parser is None:
         raise ValueError("Unknown type t(%s) for single parse" % (targetType,))
+    return parser(line)
 
 
 def parseMulti(lines: typing.Iterator[str],
@@ -67,23 +98,54 @@ def parseMulti(lines: typing.Iterator[str],
     Parse multiple lines with given target type and dimension.
     This may raise ValueError.
     """
-    if dimension == 0:
-        if targetType is not Const.IOVariableTypes.STRING:
-            result = parseSingle(next(lines), targetType)
+    constraint = Const.IODataTypesInfo[targetType]["constraint"]
+    integerRange = Const.IODataTypesIntegerRange.get(targetType, None)
+
+    def nextLine() -> str:
+        try:
+            return next(lines)
+        except StopIteration:
+            raise ValueError("Not enough lines to parse") from None
+
+    def recursion(dimension: int):
+        if dimension == 1 and targetType is not Const.IOVariableTypes.STRING:
+            size: int = parseSingle(nextLine(), Const.IOVariableTypes.INT)
+            if size < 0:
+                raise ValueError("Invalid negative array size %d" % (size,))
+            result = list(map(singleParsers[targetType], islice(lines, size)))
+            if len(result) != size:
+                raise ValueError("Not enough lines to parse")
+            if integerRange is not None:  # Check whole row by min/max
+                if result and not (integerRange[0] <= min(result) and
+                                   max(result) <= integerRange[1]):
+                    raise ValueError("Parsed data failed on constraint func")
+            elif not all(map(constraint, result)):
+                raise ValueError("Parsed data failed on constraint func")
+            return result
+        elif dimension == 0:
+            if targetType is not Const.IOVariableTypes.STRING:
+                result = parseSingle(nextLine(), targetType)
+            else:
+                length = parseSingle(nextLine(), Const.IOVariableTypes.INT)
+                if length < 0:
+                    raise ValueError(
+                        "Invalid negative string length %d" % (length,))
+                result = "".join(map(chr, map(int, islice(lines, length))))
+                if len(result) != length:
+                    raise ValueError("Not enough lines to parse")
+            if not constraint(result):
+                raise ValueError("Parsed data failed on constraint func")
+            return result
         else:
-            length = parseSingle(next(lines), Const.IOVariableTypes.INT)
-            result = "".join(chr(parseSingle(next(lines), Const.IOVariableTypes.INT))
-                             for _ in range(length))
-        if not Const.IODataTypesInfo[targetType]["constraint"](result):
-            raise ValueError("Parsed data failed on constraint func")
-        return result
-    else:
-        size: int = parseSingle(next(lines), Const.IOVariableTypes.INT)
-        result = [parseMulti(lines, targetType, dimension - 1)
-                  for _ in range(size)]
-        if dimension > 1 and len(set(len(element) for element in result)) > 1:
-            raise ValueError("Generated non-rectangle array")
-        return result
+            size: int = parseSingle(nextLine(), Const.IOVariableTypes.INT)
+            if size < 0:
+                raise ValueError("Invalid negative array size %d" % (size,))
+            result = [recursion(dimension - 1) for _ in range(size)]
+            if dimension > 1 and len(set(map(len, result))) > 1:
+                raise ValueError("Generated non-rectangle array")
+            return result
+
+    return recursion(dimension)
 
 
 def isCorrectAnswer(answer, produced, returnType: Const.IOVariableTypes,
@@ -91,13 +153,24 @@ def isCorrectAnswer(answer, produced, returnType: Const.IOVariableTypes,
     """
     Return if produced answer is correct.
     """
-    if dimension > 0:
-        if not isinstance(produced, list) or len(answer) != len(produced):
-            return False
-        for element1, element2 in zip(answer, produced):
-            if not isCorrectAnswer(
-                    element1, element2, returnType, dimension - 1):
+    if returnType not in (Const.IOVariableTypes.FLOAT,
+                          Const.IOVariableTypes.DOUBLE):
+        # Exact equality; Nested lists are compared by C-level `==`.
+        return answer == produced
+
+    equal = Const.IODataTypesInfo[returnType]["equal"]
+    stack = [(answer, produced, dimension)]
+    while stack:
+        answer, produced, dimension = stack.pop()
+        if dimension > 0:
+            if type(produced) is not list or len(answer) != len(produced):
                 return False
-        return True
-    else:
-        return Const.IODataTypesInfo[returnType]["equal"](answer, produced)
+            elif dimension == 1:  # Innermost row
+                if not all(map(equal, answer, produced)):
+                    return False
+            else:
+                stack.extend((element1, element2, dimension - 1)
+                             for element1, element2 in zip(answer, produced))
+        elif not equal(answer, produced):
+            return False
+    return True
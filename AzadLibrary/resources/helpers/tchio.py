@@ -2,6 +2,7 @@ import typing
 from sys import stderr
 from decimal import Decimal
 from fractions import Fraction
+from itertools import islice
 import traceback
 
 
@@ -37,8 +38,10 @@ def parseMulti(lines: typing.Iterator[str], targetType: type, dimension: int):
             return parseSingle(next(lines), targetType)
         else:
             length = parseSingle(next(lines), int)
-            return "".join(chr(parseSingle(next(lines), int))
-                           for _ in range(length))
+            assert length >= 0, "Invalid negative string length %d" % (length,)
+            result = "".join(map(chr, map(int, islice(lines, length))))
+            assert len(result) == length
+            return result
     else:
         size: int = parseSingle(next(lines), int)
         return [parseMulti(lines, targetType, dimension - 1)
@@ -68,7 +71,8 @@ def yieldStrized(value: typing.Union[int, float, bool, str],
     elif targetType is str:
         assert isinstance(value, str)
         yield str(len(value))
-        yield from (str(ord(ch)) for ch in value)
+        if value:  # All character codes in one chunk
+            yield "\n".join(map(str, map(ord, value)))
     else:
         raise TypeError
 